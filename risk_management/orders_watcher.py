@@ -5,17 +5,69 @@ import csv
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
-from utils.result_paths import today_str
+from utils.result_paths import today_str, kst_day_index
 from risk_management.trading_results import TradingResultStore
 
 logger = logging.getLogger(__name__)
 
+# side/action 동의어 → buy/sell (대문자 원문은 그대로 조회되도록 함께 등록)
+_SIDE_MAP: Dict[str, str] = {}
+for _k, _v in {
+    "buy": "buy", "enter": "buy", "open": "buy", "buy_long": "buy",
+    "sell": "sell", "exit": "sell", "sell_short": "sell", "close": "sell",
+}.items():
+    _SIDE_MAP[_k] = _SIDE_MAP[_k.upper()] = _v
+del _k, _v
+
+
+def _resolve_side(raw: str, qty: int) -> Tuple[str, int]:
+    """
+    side/action 원문 해석 → (side, qty)
+    - 인식되는 side면 qty는 그대로 (음수 수량 행은 스토어의 qty <= 0 검사에서 걸러짐)
+    - side를 알 수 없을 때만 음수 수량을 매도로 간주
+    """
+    side = _SIDE_MAP.get(raw)
+    if side is None:
+        key = raw.strip().lower()
+        side = _SIDE_MAP.get(key)
+        if side is None:
+            if qty < 0:
+                return "sell", -qty
+            return key, qty
+    return side, qty
+
+
+# TradeRow 필드/meta 고정 키로 이미 전달되는 CSV 컬럼 (meta에 중복 보관하지 않음)
+_ROW_KNOWN = frozenset({
+    "ts", "time", "side", "action", "symbol", "stk_cd", "종목코드", "qty", "수량",
+    "price", "단가", "fee", "strategy", "status", "resp_code", "resp_msg",
+})
+
+
+def _row_meta(row: Dict[str, Any], status: str) -> Dict[str, Any]:
+    """CSV 원문 상태/코드/메시지 + 알려지지 않은 나머지 컬럼만 meta로"""
+    meta = {k: v for k, v in row.items() if k not in _ROW_KNOWN}
+    meta["status"] = status
+    meta["resp_code"] = (row.get("resp_code") or "").strip()
+    meta["resp_msg"] = (row.get("resp_msg") or "").strip()
+    return meta
+
+
+def _safe_int(v, d=0):
+    try: return int(str(v).strip())
+    except: return d
+
+
+def _safe_float(v, d=0.0):
+    try: return float(str(v).strip())
+    except: return d
+
 
 # =========================================================
 # Watcher 설정 구조체
@@ -27,9 +79,15 @@ class WatcherConfig:
     file_pattern: str = "orders_{date}.csv"
     poll_ms: int = 700
     bootstrap_if_missing: bool = True
+    # 같은 날에는 경로 계산/mkdir/exists 생략 (KST 일 인덱스 정수 비교만)
+    _cached_day: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_path: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
 
     def resolve_today_path(self) -> Path:
-        """오늘자 orders CSV 경로 계산"""
+        """오늘자 orders CSV 경로 계산 (일자가 바뀐 경우에만 재계산)"""
+        day = kst_day_index(time.time_ns())
+        if day == self._cached_day and self._cached_path is not None:
+            return self._cached_path
         f = self.file_pattern.format(date=today_str())
         full_path = self.base_dir / self.subdir / f
         full_path.parent.mkdir(parents=True, exist_ok=True)
@@ -39,6 +97,7 @@ class WatcherConfig:
                 encoding="utf-8"
             )
 
+        self._cached_day, self._cached_path = day, full_path
         return full_path
 
 
@@ -64,6 +123,25 @@ class OrdersCSVWatcher(QObject):
         self._fieldnames: Optional[List[str]] = None
         self._last_path: Optional[Path] = None
         self._last_mtime: int = 0
+        self._resume_from_store_checkpoint()
+
+    def _resume_from_store_checkpoint(self) -> None:
+        """스토어가 부트스트랩으로 이미 반영한 구간은 건너뛰고 그 뒤부터 이어 읽기"""
+        try:
+            ckpt = self.store.bootstrap_checkpoint()
+        except AttributeError:
+            return
+        if not ckpt:
+            return
+        path, offset, fieldnames = ckpt
+        try:
+            same = path.resolve() == self.csv_path.resolve()
+        except OSError:
+            same = False
+        if same and fieldnames:
+            self._last_offset = offset
+            self._fieldnames = fieldnames
+            logger.info(f"OrdersCSVWatcher resume from store checkpoint → offset={offset}")
 
     # =========================================================
     # 시작 / 종료
@@ -105,8 +183,13 @@ class OrdersCSVWatcher(QObject):
                     self._fieldnames = None
                     self._last_mtime = 0
 
-                # 1) 파일 존재 없으면 다음 루프
-                if not self.csv_path.exists():
+                # 1) 파일 존재 없으면 다음 루프 (exists()+stat() 대신 stat 1회로 판정)
+                try:
+                    stat = self.csv_path.stat()
+                except FileNotFoundError:
+                    stat = None
+
+                if stat is None:
                     # 부트스트랩 옵션이면 헤더 파일 생성
                     if getattr(self.config, "bootstrap_if_missing", False):
                         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
@@ -119,7 +202,6 @@ class OrdersCSVWatcher(QObject):
                     continue
 
                 # 2) 파일 축소/재작성 감지 (예: 로그 로테이션)
-                stat = self.csv_path.stat()
                 cur_mtime = int(stat.st_mtime)
                 cur_size = stat.st_size
 
@@ -184,43 +266,27 @@ class OrdersCSVWatcher(QObject):
     # =========================================================
     # CSV 라인 처리
     # =========================================================
-    def _safe_int(v, d=0):
-        try: return int(str(v).strip())
-        except: return d
-
-    def _safe_float(v, d=0.0):
-        try: return float(str(v).strip())
-        except: return d
-
     def _process_row(self, row: Dict[str, str]) -> None:
         try:
-            symbol  = row.get("symbol") or row.get("stk_cd") or row.get("종목코드")
-            side    = (row.get("side") or row.get("action") or "").strip().lower()
-            qty     = _safe_int(row.get("qty") or row.get("수량"), 0)
-            price   = _safe_float(row.get("price") or row.get("단가"), 0.0)
-            strategy= (row.get("strategy") or "default").strip()
-
-            # 동의어 정규화
-            if side in {"enter","open","buy_long"}: side="buy"
-            elif side in {"exit","sell_short","close"}: side="sell"
-
-            # CSV 원문 상태/코드/메시지를 meta에 모두 담음
-            status_raw = (row.get("status") or "").strip()
-            meta = {
-                "status": status_raw,
-                "resp_code": (row.get("resp_code") or "").strip(),
-                "resp_msg": (row.get("resp_msg") or "").strip(),
-                **row,  # 필요시 원문 전부 보존
-            }
+            g = row.get  # 행마다 십여 번 조회하므로 bound method 1회만 바인딩
+            symbol  = g("symbol") or g("stk_cd") or g("종목코드")
+            side, qty = _resolve_side(g("side") or g("action") or "",
+                                      _safe_int(g("qty") or g("수량"), 0))
+            price   = _safe_float(g("price") or g("단가"), 0.0)
+            strategy= (g("strategy") or "default").strip()
+
+            # TradeRow 필드와 겹치는 컬럼은 빼고 meta 구성 (원문 row 전체 복사 안 함)
+            status_raw = (g("status") or "").strip()
+            meta = _row_meta(row, status_raw)
 
             # 공개 API 유지: apply_trade(...) 그대로 호출
-            # (status와 meta를 전달하면 스토어 내부에서 'order' vs 'trade'를 구분)
+            # (status/meta의 resp_code로 스토어가 실패·거절 주문을 걸러냄)
             self.store.apply_trade(
-                symbol, side, qty, price,
+                symbol=symbol, side=side, qty=qty, price=price,
                 strategy=strategy,
                 status=status_raw,
                 meta=meta,
-                time=row.get("ts")  # 있으면 사용
+                time=g("ts")  # 있으면 사용
             )
 
             self.new_trade_detected.emit(row)
@@ -240,18 +306,16 @@ def rebuild_store_from_all_csv(store: TradingResultStore, base_dir: Path) -> int
             reader = csv.DictReader(f)
             for row in reader:
                 total += 1
+                side, qty = _resolve_side(row.get("action") or row.get("side") or "",
+                                          _safe_int(row.get("qty") or 0))
                 store.apply_trade(
-                    row.get("stk_cd") or row.get("symbol"),
-                    (row.get("action") or row.get("side")),
-                    _safe_int(row.get("qty") or 0),
-                    _safe_float(row.get("price") or 0.0),
+                    symbol=row.get("stk_cd") or row.get("symbol"),
+                    side=side,
+                    qty=qty,
+                    price=_safe_float(row.get("price") or 0.0),
                     strategy=(row.get("strategy") or "default"),
                     status=(row.get("status") or ""),
-                    meta={
-                        "resp_code": (row.get("resp_code") or "").strip(),
-                        "resp_msg":  (row.get("resp_msg")  or "").strip(),
-                        **row,
-                    },
+                    meta=_row_meta(row, (row.get("status") or "").strip()),
                     time=row.get("ts")
                 )
 
@@ -7,6 +7,12 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from utils.result_paths import path_today
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 def _code6(s: str) -> str:
@@ -40,9 +46,11 @@ class TradingResultReader:
             if self._mtime is not None and mtime == self._mtime:
                 return  # 변경 없음
 
-            # 전체 읽기 → 파싱 → 정상 시에만 캐시 교체
-            text = self._path.read_text(encoding="utf-8")
-            data = json.loads(text)
+            # 전체 읽기 → 파싱 → 정상 시에만 캐시 교체 (orjson은 bytes를 바로 파싱)
+            if _HAS_ORJSON:
+                data = orjson.loads(self._path.read_bytes())
+            else:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
             if not isinstance(data, dict):
                 return
 
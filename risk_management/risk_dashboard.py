@@ -8,11 +8,13 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import deque
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget,
@@ -26,6 +28,12 @@ try:
 except Exception:
     _HAS_MPL = False
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 # --------------------------------------------------
 # CSV Watcher import
 # --------------------------------------------------
@@ -103,6 +111,49 @@ STYLES = {
     """,
 }
 
+# ==================================================
+# JSON 로더 (QThreadPool 워커)
+# ==================================================
+class _JsonLoadSignals(QObject):
+    loaded = Signal(dict)
+    failed = Signal(str)
+
+
+class _JsonLoader(QRunnable):
+    """결과 JSON 읽기/파싱을 UI 스레드 밖에서 수행 → 시그널로 결과 전달"""
+
+    def __init__(self, path: Path, before_read: Optional[Callable[[], None]] = None):
+        super().__init__()
+        self.path = path
+        self.before_read = before_read   # 읽기 직전 워커에서 실행 (예: store.flush — 디스크 동기화 대기)
+        self.signals = _JsonLoadSignals()
+
+    def run(self):
+        try:
+            if self.before_read is not None:
+                self.before_read()
+            if _HAS_ORJSON:
+                data = orjson.loads(self.path.read_bytes())
+            else:
+                with self.path.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+            self.signals.loaded.emit(data)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+# 결과 JSON의 종목 항목 필드 (TradingResultStore가 항상 모두 기록)
+_STOCK_FIELDS = itemgetter("qty", "avg_price", "realized", "roi_pct")
+
+
+def _stock_fields(s: Dict[str, Any]):
+    """(qty, avg_price, realized, roi_pct) — 필드가 빠진 구버전 파일만 .get() 폴백"""
+    try:
+        return _STOCK_FIELDS(s)
+    except KeyError:
+        return s.get("qty", 0), s.get("avg_price", 0.0), s.get("realized", 0.0), s.get("roi_pct", 0.0)
+
+
 # ==================================================
 # RiskDashboard Main Class
 # ==================================================
@@ -131,7 +182,8 @@ class RiskDashboard(QGroupBox):
         self._on_daily_report = on_daily_report or (lambda: None)
 
         self._current_state: Dict[str, Any] = {}
-        self._pnl_snapshots: List[float] = []
+        self._refreshing = False  # JSON 로드 중복 방지
+        self._pnl_snapshots: deque[float] = deque(maxlen=30)  # 최근 30회만 유지
 
         self._init_ui()
         self._init_timer()
@@ -162,6 +214,8 @@ class RiskDashboard(QGroupBox):
             self._fig = Figure(figsize=(6, 2.5), facecolor=COLORS["bg_medium"])
             self._canvas = FigureCanvas(self._fig)
             self._ax = self._fig.add_subplot(111)
+            self._pnl_line = None   # 최초 갱신 시 생성 후 재사용
+            self._pnl_fill = None
             layout.addWidget(self._canvas)
 
         # Table
@@ -243,21 +297,47 @@ class RiskDashboard(QGroupBox):
                 )
                 return
 
-            store = TradingResultStore(str(self.json_path))
-            logger.info("[RiskDashboard] CSV→JSON 수동 동기화 완료")
+            # CSV 파싱은 watcher가 공유 스토어에 이미 반영 → 재파싱하지 않음
+            # (watcher 초기화 실패 시에만 1회 부트스트랩)
+            if getattr(self, "store", None) is None:
+                self.store = TradingResultStore(str(self.json_path))
+                logger.info("[RiskDashboard] CSV→JSON 수동 동기화 완료")
+            # 파일 IO/파싱은 워커에서, UI 반영은 _on_json_loaded(메인 스레드)에서
+            if self._refreshing:
+                return
+            self._refreshing = True
+            # 누적 파일은 체결마다 쓰지 않으므로 누적 탭은 읽기 직전에 확정
+            # (flush는 writer의 디스크 기록/동기화를 기다리므로 UI 스레드가 아닌 워커에서 호출)
+            before = self.store.flush if self.json_path == self.store.cumulative_json else None
+            loader = _JsonLoader(self.json_path, before)
+            loader.signals.loaded.connect(self._on_json_loaded)
+            loader.signals.failed.connect(self._on_json_failed)
+            QThreadPool.globalInstance().start(loader)
 
-            with self.json_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+        except Exception as e:
+            self._refreshing = False
+            logger.exception(f"[RiskDashboard] refresh_json() failed: {e}")
+            self.lbl_status.setText("⚠️ 동기화 실패")
+            self.lbl_status.setStyleSheet(f"color: {COLORS['danger']}; font-size: 12px;")
+
+    @Slot(dict)
+    def _on_json_loaded(self, data: dict):
+        self._refreshing = False
+        try:
             self._current_state = data
             self._update_ui_from_json(data)
 
             self.lbl_status.setText(f"● 갱신 완료: {datetime.now().strftime('%H:%M:%S')}")
             self.lbl_status.setStyleSheet(f"color: {COLORS['success']}; font-size: 12px;")
-
         except Exception as e:
-            logger.exception(f"[RiskDashboard] refresh_json() failed: {e}")
-            self.lbl_status.setText("⚠️ 동기화 실패")
-            self.lbl_status.setStyleSheet(f"color: {COLORS['danger']}; font-size: 12px;")
+            logger.exception(f"[RiskDashboard] UI update failed: {e}")
+
+    @Slot(str)
+    def _on_json_failed(self, err: str):
+        self._refreshing = False
+        logger.error(f"[RiskDashboard] JSON load failed: {err}")
+        self.lbl_status.setText("⚠️ 동기화 실패")
+        self.lbl_status.setStyleSheet(f"color: {COLORS['danger']}; font-size: 12px;")
 
     @Slot(list)
     def _on_csv_updated(self, all_rows: list):
@@ -270,23 +350,17 @@ class RiskDashboard(QGroupBox):
         summary = data.get("summary") or {}
         stocks = data.get("stocks") or {}
 
-        realized = float(summary.get("realized_pnl_net", 0.0))
-        roi = sum(s.get("roi_pct", 0.0) for s in stocks.values()) / max(len(stocks), 1)
+        realized_total = float(summary.get("realized_pnl_net", 0.0))
         trades = int(summary.get("trades", 0))
         total_symbols = int(summary.get("total_symbols", len(stocks)))
 
-        self._set_card_value(self.card_pnl, f"{realized:,.0f}원", realized)
-        self._set_card_value(self.card_roi, f"{roi:.2f}%", roi)
-        self._set_card_value(self.card_trades, f"{trades}", trades)
-        self._set_card_value(self.card_symbols, f"{total_symbols}", total_symbols)
-
+        # 종목 순회 1회로 테이블 채우기 + ROI 합산을 함께 처리
+        roi_sum = 0.0
         tbl = self.tbl_positions
         tbl.setRowCount(len(stocks))
         for i, (code, s) in enumerate(stocks.items()):
-            qty = int(s.get("qty", 0))
-            avg_price = float(s.get("avg_price", 0.0))
-            realized = float(s.get("realized", 0.0))
-            roi_pct = float(s.get("roi_pct", 0.0))
+            qty, avg_price, realized, roi_pct = _stock_fields(s)
+            roi_sum += roi_pct
             row = [
                 code,
                 f"{qty}",
@@ -304,8 +378,14 @@ class RiskDashboard(QGroupBox):
                 it.setTextAlignment(Qt.AlignCenter)
                 tbl.setItem(i, col, it)
 
+        roi = roi_sum / max(len(stocks), 1)
+        self._set_card_value(self.card_pnl, f"{realized_total:,.0f}원", realized_total)
+        self._set_card_value(self.card_roi, f"{roi:.2f}%", roi)
+        self._set_card_value(self.card_trades, f"{trades}", trades)
+        self._set_card_value(self.card_symbols, f"{total_symbols}", total_symbols)
+
         if _HAS_MPL:
-            self._update_chart(realized)
+            self._update_chart(realized_total)
 
     def _set_card_value(self, card: QFrame, text: str, val: float):
         lbl = card.findChild(QLabel, "value_label")
@@ -316,13 +396,24 @@ class RiskDashboard(QGroupBox):
     def _update_chart(self, realized_pnl: float):
         try:
             self._pnl_snapshots.append(realized_pnl)
-            if len(self._pnl_snapshots) > 30:
-                self._pnl_snapshots.pop(0)
-            self._ax.clear()
-            self._ax.plot(self._pnl_snapshots, color=COLORS["chart_line"], linewidth=2)
-            self._ax.fill_between(range(len(self._pnl_snapshots)), self._pnl_snapshots, alpha=0.2, color=COLORS["chart_line"])
-            self._ax.set_facecolor(COLORS["chart_bg"])
-            self._ax.tick_params(colors=COLORS["text_secondary"], labelsize=9)
+            xs = range(len(self._pnl_snapshots))
+            ys = list(self._pnl_snapshots)
+
+            if self._pnl_line is None:
+                # 최초 1회: 라인 아티스트 + 정적 스타일 구성
+                self._pnl_line, = self._ax.plot(xs, ys, color=COLORS["chart_line"], linewidth=2)
+                self._ax.set_facecolor(COLORS["chart_bg"])
+                self._ax.tick_params(colors=COLORS["text_secondary"], labelsize=9)
+            else:
+                # 이후: Axes.clear() 없이 데이터만 교체
+                self._pnl_line.set_data(xs, ys)
+
+            if self._pnl_fill is not None:
+                self._pnl_fill.remove()
+            self._pnl_fill = self._ax.fill_between(xs, ys, alpha=0.2, color=COLORS["chart_line"])
+
+            self._ax.relim()
+            self._ax.autoscale_view()
             self._canvas.draw_idle()
         except Exception:
             pass
@@ -335,6 +426,8 @@ class RiskDashboard(QGroupBox):
                 self._timer.stop()
             if hasattr(self, "csv_watcher"):
                 self.csv_watcher.stop()
+            if getattr(self, "store", None) is not None:
+                self.store.shutdown()
             logger.info("[RiskDashboard] auto refresh stopped (timer+watcher)")
         except Exception:
             pass
@@ -1,21 +1,37 @@
 """
 risk_management/trading_results.py
 갱신형(JSON 기반) 트레이딩 결과 관리
-- trading_results_YYYY-MM-DD.json : 일별 누적 상태 (overwrite 저장)
-- trading_results.json            : 전체 누적 상태 (overwrite 저장)
+- trading_results_YYYY-MM-DD.json : 일별 누적 상태 (체결 후 100ms 디바운스로 overwrite 저장)
+- trading_results.json            : 전체 누적 상태 (flush/shutdown/reset 시 저장)
 """
 from __future__ import annotations
 
+import atexit
 import json
 import csv
+import os
+import queue
+import sys
+import tempfile
 import threading
 import logging
+import math
+import time
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Any, List, Callable
+from types import MappingProxyType
+from typing import Deque, Dict, Iterable, Optional, Any, List, Callable, Tuple
 from datetime import datetime, timezone, timedelta
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer, QMetaObject, Qt
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
 
 # ---------------------------------------------------------------------
 # 기본 설정
@@ -33,10 +49,70 @@ def now_iso() -> str:
 def get_today_str() -> str:
     return datetime.now(KST).date().isoformat()
 
+_TS_CACHE = (0, "")  # (epoch 초, ISO 문자열) — 튜플 통째로 교체해 스레드 간 불일치 방지
+def _now_iso_cached() -> str:
+    """초 단위로 캐시한 now_iso() (같은 초에 몰린 체결은 문자열 재사용)"""
+    global _TS_CACHE
+    sec = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] != sec:
+        cached = _TS_CACHE = (sec, datetime.fromtimestamp(sec, KST).isoformat())
+    return cached[1]
+
+_WRITE_COALESCE_SEC = 0.1   # 백그라운드 writer가 저장 요청을 모으는 최대 시간
+_SNAPSHOT_DEBOUNCE_MS = 100  # 연속 체결 시 상태 빌드/store_updated emit을 묶는 간격
+
+def _as_str(v: Any, default: str = "") -> str:
+    """이미 str이면 그대로 (str() 재호출/할당 생략), None이면 default"""
+    if type(v) is str:
+        return v
+    return default if v is None else str(v)
+
+def _as_int(v: Any, default: int = 0) -> int:
+    """이미 int면 그대로 (type 비교만, int() 변환 프로토콜 생략)"""
+    if type(v) is int:
+        return v
+    return default if v is None else int(v)
+
+def _as_float(v: Any, default: float = 0.0) -> float:
+    """이미 float면 그대로, int/str 등만 float()로 변환"""
+    if type(v) is float:
+        return v
+    return default if v is None else float(v)
+
+def _canon_side(v: Any) -> str:
+    """이미 정규화된 'buy'/'sell'은 그대로, 그 외에만 lower() (watcher가 정규화한 값 재처리 방지)"""
+    side = _as_str(v)
+    return side if side == "buy" or side == "sell" else side.lower()
+
+# 체결로 치지 않는 주문 상태 (TradeLogger가 CSV에 남기는 실패/거절/미제출 기록)
+_FAILED_STATUSES = frozenset({"ERROR", "SKIPPED", "ORDER_CANCEL", "ORDER_REJECT"})
+
+def _is_failed_order(status: Any, meta: Optional[Dict[str, Any]]) -> bool:
+    """
+    실패/거절 주문 행 여부 — 포지션/손익에 반영하지 않음
+    - ERROR/SKIPPED/ORDER_CANCEL/ORDER_REJECT, UNHANDLED_MODE:*, 2xx가 아닌 HTTP_xxx
+    - meta의 resp_code가 0이 아닌 경우 (브로커 return_code 실패)
+    - 그 외(filled, FILLED, SIM_SUBMIT, 빈 값 등)는 체결로 반영
+    """
+    st = _as_str(status).strip().upper()
+    if st in _FAILED_STATUSES or st.startswith("UNHANDLED_MODE"):
+        return True
+    if st.startswith("HTTP_") and not st[5:].startswith("2"):
+        return True
+    if meta:
+        rc = _as_str(meta.get("resp_code")).strip()
+        if rc and rc not in ("0", "None"):
+            return True
+    return False
+
+# fdatasync는 POSIX 전용 (Windows/macOS는 fsync)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
 # ---------------------------------------------------------------------
 # 데이터 모델
 # ---------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class TradeRow:
     time: str
     side: str
@@ -49,7 +125,15 @@ class TradeRow:
     meta: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class BuyLot:
+    """FIFO 매수 lot (dict 대신 slots → 키 해시 없이 속성 접근, time은 첫 매수 시각)"""
+    price: float
+    qty: int
+    time: str
+
+
+@dataclass(slots=True)
 class SymbolPosition:
     code: str
     qty: int = 0
@@ -60,13 +144,67 @@ class SymbolPosition:
     realized_roi_pct: float = 0.0
     buy_count: int = 0
     sell_count: int = 0
-    buy_history: List[Dict[str, Any]] = field(default_factory=list)
+    buy_history: Deque[BuyLot] = field(default_factory=deque)  # FIFO 매수 lot
+
+
+def _json_default(obj: Any) -> Any:
+    """SymbolPosition → 저장용 dict (종목별 중간 dict 컴프리헨션 없이 직렬화 시점에 변환)"""
+    if isinstance(obj, SymbolPosition):
+        return {
+            "qty": obj.qty,
+            "avg_price": obj.avg_price,
+            "realized": obj.cumulative_realized,
+            "roi_pct": obj.realized_roi_pct,
+            "buy_count": obj.buy_count,
+            "sell_count": obj.sell_count,
+            "total_cost_sold": obj.total_cost_sold,
+        }
+    raise TypeError(f"not JSON serializable: {type(obj).__name__}")
+
+
+def _position_vars(pos: SymbolPosition) -> Dict[str, Any]:
+    """snapshot()용 종목 복사본 (기존 vars(pos)와 같은 키, buy_history는 lot dict 목록)"""
+    return {
+        "code": pos.code,
+        "qty": pos.qty,
+        "avg_price": pos.avg_price,
+        "total_buy_amt": pos.total_buy_amt,
+        "cumulative_realized": pos.cumulative_realized,
+        "total_cost_sold": pos.total_cost_sold,
+        "realized_roi_pct": pos.realized_roi_pct,
+        "buy_count": pos.buy_count,
+        "sell_count": pos.sell_count,
+        "buy_history": [{"price": lot.price, "qty": lot.qty, "time": lot.time} for lot in pos.buy_history],
+    }
+
+
+def _dump_state(data: Dict[str, Any]) -> bytes:
+    # 키 정렬: 체결 순서와 무관하게 같은 상태 → 같은 바이트 (파일 diff 안정)
+    # 들여쓰기 없는 compact 출력 (크기 2~3배 감소, 사람이 볼 때는 jq 등으로 정렬)
+    if _HAS_ORJSON:
+        # dataclass 네이티브 직렬화를 끄고 _json_default로 필드 선택
+        return orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SORT_KEYS,
+        )
+    return json.dumps(
+        data, default=_json_default, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
 
 # ---------------------------------------------------------------------
 # 본체
 # ---------------------------------------------------------------------
 class TradingResultStore(QObject):
-    """CSV 기반 → JSON 결과 누적 갱신 (overwrite 방식)"""
+    """
+    CSV 기반 → JSON 결과 누적 갱신 (overwrite 방식)
+
+    snapshot() 계약:
+    - positions는 lock 아래에서 뜬 종목별 dict 복사본 (키는 기존 vars(pos)와 동일, watcher 스레드의 체결 반영과 무관하게 일관됨)
+    - 복사본은 상태 저장(_save_json_state) 시 새로 만들어 참조만 교체(publish)하고, 변경이 없으면 같은 객체를 재사용한다.
+    - snapshot()은 lock 없이 공개된 참조만 반환 (디바운스 저장 전의 체결은 아직 반영되지 않음)
+    - 공개된 객체는 호출자 간 공유되므로 읽기만 하고, 변경이 필요하면 직접 복사해서 사용한다.
+    """
     store_updated = Signal()
 
     def __init__(self, json_path: Optional[str | Path] = None, *, filename_prefix="trading_results"):
@@ -81,11 +219,63 @@ class TradingResultStore(QObject):
         self.cumulative_json = base_dir / f"{filename_prefix}.json"
 
         self._positions: Dict[str, SymbolPosition] = {}
-        self._lock = threading.RLock()
+        # 재진입 없음: 락은 공개 메서드에서만 1회 획득, _save_json_state/_flush_cumulative 등은 보유 상태 전제
+        self._lock = threading.Lock()
+
+        # summary 러닝 합계 (저장 시 전 종목 재합산 방지)
+        self._total_realized = 0.0
+        self._total_trades = 0
+        self._save_count = 0
+        self._cumulative_dirty = False
+        # 경로별 마지막 기록 상태 지문 (같은 상태면 직렬화/쓰기 생략)
+        # _state_gen은 종목 추가나 reset/rebuild처럼 trades 카운터로 드러나지 않는 변경마다 증가
+        self._state_gen = 0
+        self._last_written: Dict[Path, Tuple[str, int, int]] = {}
+        # 마지막으로 공개한 (지문, snapshot 복사본) — 저장 시 통째로 교체, 읽기는 참조만
+        # (첫 저장 전에도 snapshot()이 빈 상태를 돌려주도록 지문 None으로 초기화)
+        self._published: Tuple[Optional[Tuple[str, int, int]], Dict[str, Any]] = (
+            None, {"date": self._current_date, "positions": MappingProxyType({})}
+        )
+
+        # 체결이 ms 단위로 몰려도 상태 빌드/emit은 디바운스 1회로 묶음
+        # (이벤트 루프가 없는 환경에서는 flush()/shutdown()이 보류분을 반영)
+        self._snapshot_dirty = False
+        self._snapshot_pending = False
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(_SNAPSHOT_DEBOUNCE_MS)
+        self._snapshot_timer.timeout.connect(self._flush_snapshots)
+
+        # 부트스트랩이 읽은 CSV 위치 (watcher가 그 뒤부터만 이어 읽도록 제공)
+        self._bootstrap_ckpt: Optional[Tuple[Path, int, List[str]]] = None
+
+        # 저장용 상태 dict는 1회만 만들고 키 값만 제자리 갱신
+        # (stocks는 _positions를 그대로 참조 → 종목별 dict 재생성 없음)
+        self._state_summary: Dict[str, Any] = {"realized_pnl_net": 0.0, "total_symbols": 0, "trades": 0}
+        self._state_template: Dict[str, Any] = {
+            "date": None,
+            "time": None,
+            "stocks": self._positions,
+            "summary": self._state_summary,
+        }
+
+        # 파일 쓰기는 백그라운드 writer가 담당 (apply_trade는 큐에 넣고 즉시 반환)
+        # writer는 큐/경로만 참조 → store가 GC되면 finalize가 종료 신호를 넣어 스레드도 정리
+        self._write_q: "queue.Queue[Any]" = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, args=(self._write_q, self.cumulative_json),
+            name="TradingResultWriter", daemon=True,
+        )
+        self._writer_thread.start()
+        self._stop_writer = weakref.finalize(self, self._write_q.put, None)
+        # shutdown()을 호출하지 않고 종료돼도 디바운스 대기분/누적 파일이 디스크에 남도록
+        # (약한 참조 등록 → 요청마다 만든 store도 atexit에 붙잡히지 않음)
+        _LIVE_STORES.add(self)
 
         # 🚀 부트스트랩 실행 (오늘 CSV 존재 시 자동 반영)
         self._bootstrap_from_csv_if_exists()
         self._save_json_state()
+        self._flush_cumulative()
         logger.info(f"[TradingResultStore] initialized | daily_json={self.daily_json.name}")
 
     # --------------------------------------------------
@@ -120,6 +310,7 @@ class TradingResultStore(QObject):
                         )
                     except Exception as e:
                         logger.warning(f"[TradingResultStore] skip row: {e}")
+                self._bootstrap_ckpt = (csv_path, f.tell(), list(reader.fieldnames or []))
             logger.info("[TradingResultStore] CSV bootstrap complete ✅")
 
         except Exception as e:
@@ -127,32 +318,55 @@ class TradingResultStore(QObject):
 
     # --------------------------------------------------
     def apply_trade(self, *args, **kwargs):
-        """매수/매도 반영 후 JSON overwrite 저장"""
+        """매수/매도 반영 후 JSON 저장 예약 (디바운스)"""
         if len(args) == 1 and isinstance(args[0], TradeRow):
             t: TradeRow = args[0]
         else:
+            # 필드 순서대로 위치 인자 생성 (time, side, symbol, qty, price, fee, status, strategy, meta)
             t = TradeRow(
-                time=kwargs.get("time") or now_iso(),
-                side=str(kwargs.get("side")).lower(),
-                symbol=str(kwargs.get("symbol")),
-                qty=int(kwargs.get("qty")),
-                price=float(kwargs.get("price")),
-                strategy=kwargs.get("strategy") or "default",
-                fee=float(kwargs.get("fee", 0.0)),
-                meta=kwargs.get("meta"),
+                kwargs.get("time") or _now_iso_cached(),
+                _canon_side(kwargs.get("side")),
+                _as_str(kwargs.get("symbol")),
+                _as_int(kwargs.get("qty")),
+                _as_float(kwargs.get("price")),
+                _as_float(kwargs.get("fee")),
+                kwargs.get("status") or "filled",
+                kwargs.get("strategy") or "default",
+                kwargs.get("meta"),
             )
 
         if not t.symbol or t.qty <= 0 or t.price <= 0:
             return
+        if _is_failed_order(t.status, t.meta):
+            return
+        # 종목/전략 문자열은 종류가 적으므로 intern → 포지션 dict 조회가 identity 비교로 끝남
+        t.symbol = sys.intern(t.symbol)
+        t.strategy = sys.intern(t.strategy or "default")
 
         with self._lock:
-            pos = self._positions.setdefault(t.symbol, SymbolPosition(code=t.symbol))
+            # setdefault는 기존 종목이어도 SymbolPosition을 매번 생성하므로 get → 없을 때만 생성
+            pos = self._positions.get(t.symbol)
+            if pos is None:
+                pos = self._positions[t.symbol] = SymbolPosition(code=t.symbol)
+                self._state_gen += 1   # 매수/매도가 아닌 행도 종목은 생기므로 지문에 반영
             if t.side == "buy":
                 self._apply_buy(pos, t)
             elif t.side == "sell":
                 self._apply_sell(pos, t)
-            self._save_json_state()
+            self._snapshot_dirty = True
+            schedule = not self._snapshot_pending
+            self._snapshot_pending = True
+
+        if schedule:
+            # 워처 스레드에서 호출될 수 있으므로 타이머 시작은 store 스레드로 위임
+            QMetaObject.invokeMethod(self._snapshot_timer, "start", Qt.QueuedConnection)
 
+    def _flush_snapshots(self):
+        """보류 중인 상태 저장을 1회 수행 후 store_updated emit (동기 반영이 필요하면 직접 호출)"""
+        with self._lock:
+            self._snapshot_pending = False
+            if self._snapshot_dirty:
+                self._save_json_state()
         self.store_updated.emit()
 
     # --------------------------------------------------
@@ -166,26 +380,39 @@ class TradingResultStore(QObject):
         pos.qty = new_qty
         pos.total_buy_amt += (t.price * t.qty)
         pos.buy_count += 1
-        pos.buy_history.append({"price": t.price, "qty": t.qty, "time": t.time})
+        self._total_trades += 1
+        lots = pos.buy_history
+        # 직전 lot과 단가가 같으면 합침 (FIFO 결과는 동일, 같은 가격 분할 매수로 lot이 무한히 늘지 않음)
+        if lots and lots[-1].price == t.price:
+            lots[-1].qty += t.qty
+        else:
+            lots.append(BuyLot(t.price, t.qty, t.time))
 
     def _apply_sell(self, pos: SymbolPosition, t: TradeRow):
         """매도 반영 + 실현 손익 계산"""
         remaining = t.qty
+        px = t.price
         total_realized, total_cost = 0.0, 0.0
-        while remaining > 0 and pos.buy_history:
-            lot = pos.buy_history[0]
-            consume = min(remaining, lot["qty"])
-            realized = (t.price - lot["price"]) * consume
-            total_realized += realized
-            total_cost += lot["price"] * consume
-            lot["qty"] -= consume
-            if lot["qty"] == 0:
-                pos.buy_history.pop(0)
+        lots = pos.buy_history
+        # 여러 lot을 한 번에 소진하는 대량 매도: 통째로 소진되는 lot은 qty 갱신 없이 바로 pop
+        while remaining > 0 and lots:
+            lot = lots[0]
+            lot_px, lot_qty = lot.price, lot.qty
+            if lot_qty <= remaining:
+                lots.popleft()
+                consume = lot_qty
+            else:
+                lot.qty = lot_qty - remaining
+                consume = remaining
+            total_realized += (px - lot_px) * consume
+            total_cost += lot_px * consume
             remaining -= consume
 
         pos.qty = max(0, pos.qty - t.qty)
         pos.cumulative_realized += total_realized
         pos.total_cost_sold += total_cost
+        self._total_realized += total_realized
+        self._total_trades += 1
 
         if pos.total_cost_sold > 0:
             pos.realized_roi_pct = (pos.cumulative_realized / pos.total_cost_sold) * 100.0
@@ -193,55 +420,253 @@ class TradingResultStore(QObject):
         pos.sell_count += 1
 
     # --------------------------------------------------
-    def _save_json_state(self):
-        """현재 상태를 JSON으로 overwrite 저장"""
-        data = {
+    def _build_state(self) -> Dict[str, Any]:
+        data = self._state_template
+        data["date"] = self._current_date
+        data["time"] = now_iso()
+        summary = self._state_summary
+        summary["realized_pnl_net"] = self._total_realized
+        summary["total_symbols"] = len(self._positions)
+        summary["trades"] = self._total_trades
+        return data
+
+    def _state_fingerprint(self) -> Tuple[str, int, int]:
+        """상태 변경 여부 판별용 지문 (매수/매도는 trades, 종목 추가/reset/rebuild는 _state_gen이 증가)"""
+        return (self._current_date, self._state_gen, self._total_trades)
+
+    def _save_if_changed(self, path: Path):
+        """마지막 기록 이후 상태가 바뀐 경우에만 직렬화 후 쓰기 예약"""
+        fp = self._state_fingerprint()
+        if self._last_written.get(path) == fp:
+            return
+        self._enqueue_write(path, _dump_state(self._build_state()))
+        self._last_written[path] = fp
+
+    def _publish_snapshot(self):
+        """snapshot() 복사본을 새로 만들어 참조 교체 (self._lock 보유 상태, 지문이 바뀐 경우만)"""
+        fp = self._state_fingerprint()
+        if self._published[0] == fp:
+            return
+        snap = {
             "date": self._current_date,
-            "time": now_iso(),
-            "stocks": {
-                code: {
-                    "qty": pos.qty,
-                    "avg_price": round(pos.avg_price, 2),
-                    "realized": round(pos.cumulative_realized, 2),
-                    "roi_pct": round(pos.realized_roi_pct, 2),
-                    "buy_count": pos.buy_count,
-                    "sell_count": pos.sell_count,
-                    "total_cost_sold": round(pos.total_cost_sold, 2)
-                }
-                for code, pos in self._positions.items()
-            },
-            "summary": {
-                "realized_pnl_net": round(sum(p.cumulative_realized for p in self._positions.values()), 2),
-                "total_symbols": len(self._positions),
-                "trades": sum(p.buy_count + p.sell_count for p in self._positions.values())
-            }
+            "positions": MappingProxyType(
+                {code: _position_vars(pos) for code, pos in self._positions.items()}
+            ),
         }
+        self._published = (fp, snap)   # 튜플 통째로 교체 → 읽는 쪽은 lock 없이 일관된 쌍을 봄
 
-        try:
-            # 일별 + 누적 동시 갱신
-            with self.daily_json.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            with self.cumulative_json.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+    def _save_json_state(self):
+        """현재 상태를 일별 JSON으로 overwrite 저장 (누적 파일은 dirty 표시만)"""
+        if __debug__:
+            self._check_totals_drift()
 
-            logger.debug(f"[TradingResultStore] JSON updated → {self.daily_json.name}")
+        try:
+            self._publish_snapshot()
+            self._save_if_changed(self.daily_json)
+            self._snapshot_dirty = False
+            self._cumulative_dirty = True
         except Exception:
             logger.exception("[TradingResultStore] Failed to write JSON state")
 
+    def _flush_cumulative(self):
+        """누적 JSON overwrite 저장 (dirty일 때만)"""
+        if self._snapshot_dirty:
+            self._save_json_state()   # 디바운스 대기 중인 일별 상태 먼저 확정
+        if not self._cumulative_dirty:
+            return
+        try:
+            self._save_if_changed(self.cumulative_json)
+            self._cumulative_dirty = False
+        except Exception:
+            logger.exception("[TradingResultStore] Failed to write cumulative JSON")
+
+    # --------------------------------------------------
+    def _enqueue_write(self, path: Path, payload: bytes):
+        if self._writer_thread.is_alive():
+            self._write_q.put((path, payload))
+        else:
+            # shutdown 이후 호출 → 동기 기록
+            self._write_file(path, payload, sync=path == self.cumulative_json)
+
+    @staticmethod
+    def _write_file(path: Path, payload: bytes, *, sync: bool = False):
+        """
+        쓰기마다 고유한 tmp 파일(mkstemp, 같은 디렉터리)에 기록 후 os.replace
+        - 같은 파일을 쓰는 store 인스턴스/writer가 여럿이어도 tmp가 겹치지 않아 대상은 항상 완성본
+        - sync=True(누적 파일)일 때만 fdatasync: 디바운스되는 일별 저장은 다음 저장이 곧 덮어쓰므로 생략
+        - 예외: Windows에서 리더가 대상을 열고 있어 replace가 실패하면 직접 덮어쓰기 (이때는 원자적이지 않음)
+        """
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+            try:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, 0o644)   # mkstemp 기본 0600 → 기존 파일과 같은 권한
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                if sync:
+                    _fdatasync(fd)
+            finally:
+                os.close(fd)
+            try:
+                os.replace(tmp, path)
+                tmp = None
+            except PermissionError:
+                path.write_bytes(payload)
+            logger.debug(f"[TradingResultStore] JSON updated → {path.name}")
+        except Exception:
+            logger.exception(f"[TradingResultStore] Failed to write {path.name}")
+        finally:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _writer_loop(write_q: "queue.Queue[Any]", cumulative_json: Path):
+        """
+        저장 요청을 최대 _WRITE_COALESCE_SEC 동안 모아 경로별 최신 payload만 기록.
+        - threading.Event : flush 대기자 (이전 요청까지 기록 후 set)
+        - None            : 종료 신호
+        (self를 잡지 않도록 staticmethod — 스레드가 store 수명을 늘리지 않음)
+        """
+        while True:
+            item = write_q.get()
+            pending: Dict[Path, bytes] = {}
+            waiters: List[threading.Event] = []
+            stop = False
+            deadline = time.monotonic() + _WRITE_COALESCE_SEC
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    path, payload = item
+                    pending[path] = payload
+                try:
+                    if stop or waiters:
+                        item = write_q.get_nowait()
+                    else:
+                        item = write_q.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            for path, payload in pending.items():
+                TradingResultStore._write_file(path, payload, sync=path == cumulative_json)
+            for ev in waiters:
+                ev.set()
+            if stop:
+                return
+
+    def _check_totals_drift(self):
+        """
+        (디버그 전용) 러닝 합계가 전체 재합산과 어긋나지 않는지 주기적으로 확인
+        - 합산 순서에 따른 float 오차는 정상이므로 상대 오차로 비교, 어긋나도 경고만 (저장은 계속)
+        """
+        self._save_count += 1
+        if self._save_count % 100:
+            return
+        realized = sum(p.cumulative_realized for p in self._positions.values())
+        trades = sum(p.buy_count + p.sell_count for p in self._positions.values())
+        if not math.isclose(realized, self._total_realized, rel_tol=1e-9, abs_tol=1e-6):
+            logger.warning(f"[TradingResultStore] total_realized drift: {self._total_realized} vs {realized}")
+        if trades != self._total_trades:
+            logger.warning(f"[TradingResultStore] total_trades drift: {self._total_trades} vs {trades}")
+
     # --------------------------------------------------
     def snapshot(self) -> Dict[str, Any]:
-        """현재 메모리 상태 반환"""
-        return {
-            "date": self._current_date,
-            "positions": {
-                code: vars(pos) for code, pos in self._positions.items()
-            }
-        }
+        """
+        마지막으로 공개된 상태 반환 (lock/복사 없이 참조 1회 읽기)
+        - 체결 후 디바운스 저장(최대 _SNAPSHOT_DEBOUNCE_MS) 전까지는 직전 상태, 즉시 반영이 필요하면 flush() 후 호출
+        """
+        return self._published[1]
+
+    def rebuild_from_trades(self, trades: Iterable[TradeRow]) -> int:
+        """
+        TradeRow 목록으로 상태를 처음부터 재계산 (오프라인 재집계용)
+        - 체결 반영은 apply_trade와 같은 _apply_buy/_apply_sell, lock/저장/emit만 1회
+        반환: 반영된 체결 수
+        """
+        applied = 0
+        with self._lock:
+            self._state_gen += 1
+            self._positions.clear()
+            self._total_realized = 0.0
+            self._total_trades = 0
+            positions = self._positions
+            for t in trades:
+                if not t.symbol or t.qty <= 0 or t.price <= 0:
+                    continue
+                if _is_failed_order(t.status, t.meta):
+                    continue
+                side = t.side
+                if side != "buy" and side != "sell":
+                    continue
+                pos = positions.get(t.symbol)
+                if pos is None:
+                    code = sys.intern(t.symbol)
+                    pos = positions[code] = SymbolPosition(code=code)
+                if side == "buy":
+                    self._apply_buy(pos, t)
+                else:
+                    self._apply_sell(pos, t)
+                applied += 1
+            self._save_json_state()
+            self._flush_cumulative()
+            n_symbols = len(positions)
+        self.store_updated.emit()
+        logger.info(f"[TradingResultStore] rebuild_from_trades applied={applied} symbols={n_symbols}")
+        return applied
+
+    def bootstrap_checkpoint(self) -> Optional[Tuple[Path, int, List[str]]]:
+        """부트스트랩에 사용한 (CSV 경로, 읽은 offset, 헤더) — 없으면 None"""
+        return self._bootstrap_ckpt
 
     def reset(self):
         """상태 초기화 (파일 유지)"""
         with self._lock:
+            if self._positions:
+                self._state_gen += 1
             self._positions.clear()
+            self._total_realized = 0.0
+            self._total_trades = 0
             self._save_json_state()
+            self._flush_cumulative()
         self.store_updated.emit()
         logger.info("[TradingResultStore] store reset complete")
+
+    def flush(self):
+        """보류 중인 누적 JSON 포함, 대기 중인 모든 쓰기가 디스크에 반영될 때까지 대기"""
+        with self._lock:
+            self._flush_cumulative()
+        if self._writer_thread.is_alive():
+            done = threading.Event()
+            self._write_q.put(done)
+            done.wait()
+
+    def shutdown(self):
+        """종료 시 호출: 누적 JSON 확정 저장 후 writer 종료"""
+        _LIVE_STORES.discard(self)
+        self.flush()
+        if self._writer_thread.is_alive():
+            self._stop_writer()   # 종료 신호 1회 (이후 GC 시 중복 전송 없음)
+            self._writer_thread.join(timeout=2.0)
+        logger.info("[TradingResultStore] shutdown complete")
+
+
+# 살아 있는 store만 약하게 추적 → 프로세스 종료 시 일괄 flush (atexit 등록은 모듈당 1회)
+_LIVE_STORES: "weakref.WeakSet[TradingResultStore]" = weakref.WeakSet()
+
+
+def _flush_live_stores():
+    for store in list(_LIVE_STORES):
+        try:
+            store.flush()
+        except Exception:
+            logger.exception("[TradingResultStore] flush at exit failed")
+
+
+atexit.register(_flush_live_stores)
@@ -201,28 +201,32 @@ class SettingsStore:
                 ),
             )
 
-        # --- 구버전 키 반영 ---
+        # --- 구버전 키 반영 (KEY가 없을 때 1회만 읽고 KEY로 승격) ---
         auto_buy = self.qs.value("auto_buy", None, type=bool)
         auto_sell = self.qs.value("auto_sell", None, type=bool)
         broker_vendor = self.qs.value("broker_vendor", None, type=str)
 
+        migrated = False
         if auto_buy is not None:
             base.auto_buy = bool(auto_buy)
+            migrated = True
         if auto_sell is not None:
             base.auto_sell = bool(auto_sell)
+            migrated = True
         if isinstance(broker_vendor, str) and broker_vendor.strip().lower() in ("sim","mirae","kiwoom","kis"):
             base.broker_vendor = broker_vendor.strip().lower()
+            migrated = True
+
+        if migrated:
+            self.qs.setValue(self.KEY, json.dumps(asdict(base), ensure_ascii=False))
 
         return base
 
     def save(self, cfg: AppSettings):
         cfg.api_base_url = _normalize_base_url(cfg.api_base_url)
 
-        # 1) QSettings
+        # 1) QSettings (KEY 하나만 기록 — 개별 구버전 키는 load()의 마이그레이션에서만 읽음)
         self.qs.setValue(self.KEY, json.dumps(asdict(cfg), ensure_ascii=False))
-        self.qs.setValue("auto_buy", cfg.auto_buy)
-        self.qs.setValue("auto_sell", cfg.auto_sell)
-        self.qs.setValue("broker_vendor", cfg.broker_vendor)
 
         # 2) 런타임 환경변수
         if cfg.api_base_url:
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+# SUT
+from risk_management.trading_results import TradingResultStore, TradeRow
+from risk_management.orders_watcher import OrdersCSVWatcher, WatcherConfig
+from utils.result_paths import today_str
+
+# -----------------------------
+# 공용 픽스처
+# -----------------------------
+@pytest.fixture
+def make_store(tmp_path: Path, monkeypatch):
+    """tmp_path 아래 logs/results에 저장하는 store 생성기 (부트스트랩 CSV도 tmp_path/logs/trades 기준)"""
+    monkeypatch.chdir(tmp_path)
+    stores = []
+    def _make():
+        s = TradingResultStore(json_path=str(tmp_path / "logs" / "results" / "trading_results.json"))
+        stores.append(s)
+        return s
+    yield _make
+    for s in stores:
+        s.shutdown()
+
+def _rows():
+    # 같은 단가 연속 매수(lot 병합), 부분/전량 매도, 실패 주문 행이 섞인 체결 목록
+    return [
+        TradeRow("09:00:01", "buy",  "005930", 10, 70000.0),
+        TradeRow("09:00:02", "buy",  "005930", 5,  70000.0),
+        TradeRow("09:00:03", "buy",  "000660", 3,  150000.0),
+        TradeRow("09:00:04", "buy",  "005930", 4,  69500.0, status="HTTP_500"),
+        TradeRow("09:00:05", "sell", "005930", 12, 71000.0),
+        TradeRow("09:00:06", "buy",  "005930", 2,  70500.0),
+        TradeRow("09:00:07", "sell", "000660", 3,  149000.0),
+        TradeRow("09:00:08", "sell", "005930", 1,  72000.0, status="ORDER_REJECT"),
+        TradeRow("09:00:09", "sell", "005930", 5,  72000.0),
+    ]
+
+# -----------------------------
+# 1) rebuild_from_trades == apply_trade 순차 반영
+# -----------------------------
+def test_rebuild_matches_apply_trade_replay(make_store):
+    live = make_store()
+    for r in _rows():
+        live.apply_trade(r)
+    live.flush()
+
+    rebuilt = make_store()
+    applied = rebuilt.rebuild_from_trades(_rows())
+
+    assert applied == 7, "실패/거절 주문 행은 재집계에서도 제외되어야 합니다."
+    a, b = live.snapshot(), rebuilt.snapshot()
+    assert dict(a["positions"]) == dict(b["positions"])
+    assert a["positions"]["005930"]["qty"] == 0
+    assert a["positions"]["000660"]["cumulative_realized"] == pytest.approx(-3000.0)
+
+# -----------------------------
+# 2) 이벤트 루프 없이도 flush()가 디바운스 대기분을 디스크에 반영
+# -----------------------------
+def test_flush_persists_pending_state(make_store):
+    s = make_store()
+    s.apply_trade(symbol="005930", side="buy", qty=3, price=70000.0)
+    s.flush()
+
+    for path in (s.daily_json, s.cumulative_json):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["stocks"]["005930"]["qty"] == 3, f"{path.name}에 보류 중인 체결이 반영되어야 합니다."
+    # mkstemp → os.replace 후 tmp 파일이 남지 않아야 함
+    assert not list(s.base_dir.glob("*.tmp"))
+
+# -----------------------------
+# 3) 상태가 그대로면 직렬화/쓰기 생략
+# -----------------------------
+def test_unchanged_state_skips_write(make_store, monkeypatch):
+    s = make_store()
+    s.apply_trade(symbol="005930", side="buy", qty=1, price=70000.0)
+    s.reset()
+    s.flush()
+
+    writes = []
+    monkeypatch.setattr(TradingResultStore, "_write_file",
+                        staticmethod(lambda path, payload, **kw: writes.append(path)))
+    s.reset()   # 이미 빈 상태 → reset은 저장을 시도하지만 지문이 같아 생략되어야 함
+    s.flush()
+    s.apply_trade(symbol="005930", side="buy", qty=0, price=70000.0)  # 무효 행 → 상태 변화 없음
+    s.flush()
+    assert writes == [], f"변경 없는 상태는 다시 쓰지 않아야 합니다. got={writes}"
+
+    s.apply_trade(symbol="005930", side="buy", qty=1, price=70000.0)
+    s.flush()
+    assert set(writes) == {s.daily_json, s.cumulative_json}
+
+# -----------------------------
+# 4) 워처는 스토어 부트스트랩이 읽은 구간을 다시 반영하지 않음
+# -----------------------------
+_CSV_HEADER = "ts,strategy,action,stk_cd,order_type,price,qty,status,resp_code,resp_msg\n"
+
+def test_watcher_resumes_after_bootstrap(make_store, tmp_path: Path):
+    csv_path = tmp_path / "logs" / "trades" / f"orders_{today_str()}.csv"
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    csv_path.write_text(
+        _CSV_HEADER
+        + "2025-01-01T09:00:01,smoke,BUY,005930,limit,70000,2,HTTP_200,0,OK\n"
+        + "2025-01-01T09:00:02,smoke,BUY,005930,limit,70000,3,HTTP_200,0,OK\n",
+        encoding="utf-8",
+    )
+    s = make_store()
+    s.flush()
+    assert s.snapshot()["positions"]["005930"]["qty"] == 5
+
+    w = OrdersCSVWatcher(s, WatcherConfig(base_dir=tmp_path / "logs", poll_ms=20))
+    w.start()
+    try:
+        with csv_path.open("a", encoding="utf-8") as f:
+            f.write("2025-01-01T09:00:03,smoke,BUY,005930,limit,70000,1,HTTP_200,0,OK\n")
+        deadline = time.monotonic() + 3.0
+        while time.monotonic() < deadline:
+            s.flush()
+            if s.snapshot()["positions"]["005930"]["qty"] != 5:
+                break
+            time.sleep(0.02)
+        time.sleep(0.1)   # 추가 폴링에서도 중복 반영이 없는지
+        s.flush()
+    finally:
+        w.stop()
+    assert s.snapshot()["positions"]["005930"]["qty"] == 6, "부트스트랩된 행은 한 번만 반영되어야 합니다."
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import csv
+import gzip
 import json
 import math
 import os
@@ -20,6 +22,12 @@ logger = logging.getLogger(__name__)  # 모듈별 로거
 from broker.base import Broker, OrderRequest, OrderResponse
 from broker.factory import create_broker
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 # =========================
 # Settings / Data Classes
 # =========================
@@ -49,20 +57,42 @@ class LadderSettings:
 # =========================
 # Logger (CSV + JSONL)
 # =========================
+_FH_BUFFER_SIZE = 64 * 1024
+# gzip JSONL은 레코드마다 sync flush하지 않고, 첫 미반영 레코드 후 이 시간 안에 1회 flush
+# (압축률 유지 + 비정상 종료 시 유실은 최대 ~1초 분량으로 제한)
+_GZ_FLUSH_SEC = 1.0
+# JSONL 레코드 전용 인코더 (compact separators, 평범한 dict만 다루므로 순환 검사 생략)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False).encode
+
+def _encode_line(obj: Dict[str, Any]) -> bytes:
+    """JSONL 1줄(개행 포함) bytes — orjson 있으면 C 인코더로 바로 bytes 생성"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (_ENCODER(obj) + "\n").encode("utf-8")
+
 class TradeLogger:
     def __init__(self, log_dir: str = "logs/trades", file_prefix: str = "orders",
-                 slim: bool = True):
+                 slim: bool = True, compress: bool = False):
         self.log_dir = Path(log_dir)
+        # prefix가 .gz로 끝나거나 compress=True면 JSONL을 gzip(level 1)으로 기록
+        if file_prefix.endswith(".gz"):
+            file_prefix, compress = file_prefix[:-3], True
         self.file_prefix = file_prefix
+        self._jsonl_suffix = ".jsonl.gz" if compress else ".jsonl"
         self._lock = threading.Lock()
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._slim = bool(slim)
+        # 경로별 파일 핸들 캐시 (레코드마다 open/close 하지 않음)
+        self._fh: Dict[Path, Any] = {}
+        self._gz_flush_timer: Optional[threading.Timer] = None
+        self._encode = _encode_line
+        atexit.register(self._close_all_fh)
 
     def _paths(self) -> Tuple[Path, Path]:
         day = datetime.now().strftime("%Y-%m-%d")
         return (
             self.log_dir / f"{self.file_prefix}_{day}.csv",
-            self.log_dir / f"{self.file_prefix}_{day}.jsonl",
+            self.log_dir / f"{self.file_prefix}_{day}{self._jsonl_suffix}",
         )
 
     @staticmethod
@@ -104,6 +134,63 @@ class TradeLogger:
                         "resp_return_code", "resp_return_msg",
                     ])
 
+    def _get_fh(self, path: Path, binary: bool = False):
+        """path의 append 핸들 반환 (날짜가 바뀌어 경로가 달라지면 이전 핸들 정리). lock 내부에서 호출"""
+        fh = self._fh.get(path)
+        if fh is not None:
+            return fh
+        # 날짜 롤오버: 같은 확장자의 이전 날짜 핸들 닫기
+        for old in [p for p in self._fh if p.suffix == path.suffix]:
+            self._close_fh(self._fh.pop(old))
+        if binary and path.suffix == ".gz":
+            # 새 gzip member로 이어붙임 (gzip.open/zcat 모두 연속 member를 읽음)
+            fh = gzip.GzipFile(fileobj=open(path, "ab", buffering=_FH_BUFFER_SIZE),
+                               mode="ab", compresslevel=1)
+        elif binary:
+            # 평문 JSONL은 레코드마다 1줄을 바로 내보내므로 버퍼 없이 O_APPEND fd에 write 1회
+            fh = open(path, "ab", buffering=0)
+        else:
+            fh = open(path, "a", newline="", encoding="utf-8", buffering=_FH_BUFFER_SIZE)
+        self._fh[path] = fh
+        return fh
+
+    @staticmethod
+    def _close_fh(fh):
+        # GzipFile은 넘겨받은 fileobj를 닫지 않으므로 하부 핸들까지 정리
+        raw = fh.fileobj if isinstance(fh, gzip.GzipFile) else None
+        for h in (fh, raw):
+            if h is None:
+                continue
+            try:
+                h.close()
+            except Exception:
+                pass
+
+    def _flush_gz(self):
+        """대기 중인 gzip 레코드를 Z_SYNC_FLUSH로 내보냄 (타이머 스레드에서 호출)"""
+        with self._lock:
+            self._gz_flush_timer = None
+            for fh in self._fh.values():
+                if isinstance(fh, gzip.GzipFile):
+                    try:
+                        fh.flush()   # 기본 zlib.Z_SYNC_FLUSH + 하부 파일 flush
+                    except Exception:
+                        pass
+
+    def _schedule_gz_flush(self):
+        """lock 내부에서 호출: 예약된 flush가 없을 때만 타이머 1개 시작"""
+        if self._gz_flush_timer is None:
+            t = threading.Timer(_GZ_FLUSH_SEC, self._flush_gz)
+            t.daemon = True
+            self._gz_flush_timer = t
+            t.start()
+
+    def _close_all_fh(self):
+        with self._lock:
+            for fh in self._fh.values():
+                self._close_fh(fh)
+            self._fh.clear()
+
     def write_order_record(self, record: Dict[str, Any]):
         # 슬림 모드만 지원
         if not self._slim:
@@ -112,7 +199,8 @@ class TradeLogger:
 
         csv_path, jsonl_path = self._paths()
         with self._lock:
-            self._ensure_csv_header(csv_path)
+            if csv_path not in self._fh:
+                self._ensure_csv_header(csv_path)
 
             ts = record.get("ts") or datetime.now(timezone.utc).isoformat()
             status = record.get("status") or record.get("status_label", "UNKNOWN")
@@ -162,11 +250,16 @@ class TradeLogger:
             try:
                 logger.debug("[AT] log.write.start slim=True")
                 logger.debug(f"[AT] log.write.entry {log_entry}")
-                with open(csv_path, "a", newline="", encoding="utf-8") as f_csv:
-                    writer = csv.DictWriter(f_csv, fieldnames=log_entry.keys())
-                    writer.writerow(log_entry)
-                with open(jsonl_path, "a", encoding="utf-8") as f_jsonl:
-                    f_jsonl.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+                f_csv = self._get_fh(csv_path)
+                csv.DictWriter(f_csv, fieldnames=log_entry.keys()).writerow(log_entry)
+                f_jsonl = self._get_fh(jsonl_path, binary=True)
+                f_jsonl.write(self._encode(log_entry))
+                # OrdersCSVWatcher가 tail 하는 CSV만 레코드 단위로 flush (open/close는 생략)
+                # 평문 JSONL은 무버퍼 핸들이라 flush 불필요, gzip은 매번 sync flush하면
+                # 압축률이 크게 떨어지므로 _GZ_FLUSH_SEC 안에 모아서 1회 flush
+                f_csv.flush()
+                if isinstance(f_jsonl, gzip.GzipFile):
+                    self._schedule_gz_flush()
             except IOError as e:
                 logger.info(f"Error writing to log file: {e}")
 
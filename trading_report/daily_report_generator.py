@@ -3,6 +3,7 @@
 # 오트 데일리 리포트 생성기 (v2.3: 미청산 포지션 포함 분석)
 # - 기능: 분석된 순수 데이터(List, Dict)와 미청산 포지션 데이터를 반환하여 UI 렌더링 모듈에 제공.
 
+import gzip
 import json
 import sys
 import math
@@ -13,6 +14,12 @@ from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict
 from dataclasses import dataclass
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
 # --- 시간대 설정 (KST) ---
 try:
     import zoneinfo
@@ -25,7 +32,7 @@ except ImportError:
     KST = _KST()
 
 # --- 데이터 모델 ---
-@dataclass
+@dataclass(slots=True)
 class Trade:
     symbol: str; strategy: str; entry_ts: datetime; exit_ts: datetime
     avg_entry_price: float; avg_exit_price: float; quantity: int
@@ -56,30 +63,54 @@ def _fmt(val: Optional[float], unit: str = "", digits: int = 1, is_int: bool = F
     return f"{val:,.{digits}f}{unit}"
 
 # --- 데이터 로딩 및 전처리 ---
+# orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스 → 기존 except 그대로 사용
+_json_loads = orjson.loads if _HAS_ORJSON else json.loads
+
+# 3.11+ fromisoformat은 'Z' 접미사를 직접 처리 → 문자열 재생성 불필요
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 def _parse_ts(ts_str: Optional[str]) -> datetime:
     if not ts_str: return datetime.now(KST)
-    try: return datetime.fromisoformat(ts_str.replace("Z", "+00:00")).astimezone(KST)
+    if ts_str[-1] == "Z" and not _ISO_ACCEPTS_Z: ts_str = ts_str[:-1] + "+00:00"
+    try: return datetime.fromisoformat(ts_str).astimezone(KST)
     except ValueError: return datetime.now(KST)
 
 # 함수 시그니처 수정: 완료된 거래 리스트와 미청산 포지션 리스트를 반환
 def load_and_pair_trades(path: Path) -> Tuple[List[Trade], List[Dict[str, Any]]]:
-    if not path.exists(): 
-        print(f"오류: 로그 파일을 찾을 수 없습니다: {path}")
-        return [], []
+    if not path.exists():
+        # TradeLogger(compress=True)로 기록된 .jsonl.gz 폴백
+        gz_path = path.with_name(path.name + ".gz")
+        if path.suffix == ".jsonl" and gz_path.exists():
+            path = gz_path
+        else:
+            print(f"오류: 로그 파일을 찾을 수 없습니다: {path}")
+            return [], []
     try:
-        with path.open("r", encoding="utf-8") as f:
-            orders = [json.loads(line) for line in f if line.strip()]
+        if path.suffix == ".gz":
+            orders = []
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                try:
+                    for line in f:
+                        if line.strip():
+                            orders.append(_json_loads(line))
+                except EOFError:
+                    pass  # 기록 중인 gzip member: 약 1초 주기로 sync flush된 레코드까지만 읽힘 → 읽힌 라인까지 사용
+        else:
+            # 한 번에 읽어 bytes 라인 단위로 파싱 (줄마다 텍스트 디코딩/이터레이터 오버헤드 제거)
+            orders = [_json_loads(line) for line in path.read_bytes().splitlines() if line.strip()]
     except (json.JSONDecodeError, IOError) as e:
         print(f"로그 파일 읽기 오류: {e}")
         return [], []
 
-    orders.sort(key=lambda x: _parse_ts(x.get("ts")))
+    # ts는 주문당 1회만 파싱 (정렬 키와 진입/청산 시각에 그대로 재사용)
+    timed = [(_parse_ts(o.get("ts")), o) for o in orders]
+    timed.sort(key=lambda x: x[0])
     # positions는 종목별로 미청산된 매수 거래(entry)들을 저장
     positions = defaultdict(lambda: {"entries": []})
     completed_trades: List[Trade] = []
     
-    for order in orders:
-        action, symbol, price, qty, strategy, ts = (order.get(k) for k in ["action", "stk_cd", "price", "qty", "strategy", "ts"])
+    for ts, order in timed:
+        action, symbol, price, qty, strategy = (order.get(k) for k in ["action", "stk_cd", "price", "qty", "strategy"])
         if not all([action, symbol, price, qty]): continue
         try: price, qty, action = float(price), int(qty), action.upper()
         except (ValueError, TypeError): continue
@@ -87,7 +118,7 @@ def load_and_pair_trades(path: Path) -> Tuple[List[Trade], List[Dict[str, Any]]]
         if action == "BUY":
             # entries에 strategy 정보도 저장하여 미청산 포지션에서 활용
             positions[symbol]["entries"].append({
-                "ts": _parse_ts(ts), 
+                "ts": ts, 
                 "qty": qty, 
                 "price": price, 
                 "strategy": strategy or "UNKNOWN"
@@ -111,7 +142,7 @@ def load_and_pair_trades(path: Path) -> Tuple[List[Trade], List[Dict[str, Any]]]
                     symbol=symbol, 
                     strategy=strategy or "UNKNOWN", # SELL order의 strategy를 사용 (일관성 유지를 위해)
                     entry_ts=min(entry_ts_list), 
-                    exit_ts=_parse_ts(ts), 
+                    exit_ts=ts, 
                     avg_entry_price=(entry_value / qty), 
                     avg_exit_price=(exit_value / qty), 
                     quantity=qty
@@ -150,20 +181,23 @@ def analyze_performance(trades: List[Trade]) -> Dict[str, Any]:
             "sharpe_ratio_annualized": 0.0, "avg_holding_min": 0.0
         }
     
-    returns = [t.pnl_pct for t in trades]; pnl_values = [t.pnl for t in trades]
-    wins, losses = [t for t in trades if t.pnl > 0], [t for t in trades if t.pnl <= 0]
     total_trades = len(trades)
-    win_rate = len(wins) / total_trades * 100 if total_trades > 0 else 0
-    gross_profit, gross_loss = sum(t.pnl for t in wins), abs(sum(t.pnl for t in losses))
+    returns = [t.pnl_pct for t in trades]
+    # 승/패 합계·건수와 equity 곡선(최대 낙폭)을 한 번의 순회로 누적
+    n_wins, gross_profit, gross_loss = 0, 0.0, 0.0
+    equity, peak, max_drawdown = 0.0, 0.0, 0.0
+    for t in trades:
+        pnl = t.pnl
+        if pnl > 0: n_wins += 1; gross_profit += pnl
+        else: gross_loss -= pnl
+        equity += pnl
+        if equity > peak: peak = equity
+        elif peak - equity > max_drawdown: max_drawdown = peak - equity
+    n_losses = total_trades - n_wins
+    win_rate = n_wins / total_trades * 100
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
-    avg_win, avg_loss = statistics.mean(t.pnl for t in wins) if wins else 0, abs(statistics.mean(t.pnl for t in losses)) if losses else 0
+    avg_win, avg_loss = (gross_profit / n_wins if n_wins else 0), (gross_loss / n_losses if n_losses else 0)
     payoff_ratio = avg_win / avg_loss if avg_loss > 0 else float('inf')
-    equity_curve = [sum(pnl_values[:i+1]) for i in range(total_trades)]
-    peak, max_drawdown = 0.0, 0.0
-    for equity in equity_curve:
-        if equity > peak: peak = equity
-        drawdown = (peak - equity)
-        if drawdown > max_drawdown: max_drawdown = drawdown
     
     # 추정 초기 자본 계산 로직 (수익률 계산을 위한 기준)
     initial_capital_guess = (abs(next((t.avg_entry_price * t.quantity for t in trades), 1)) * 5) or 1
@@ -172,7 +206,7 @@ def analyze_performance(trades: List[Trade]) -> Dict[str, Any]:
     sharpe_ratio = (statistics.mean(returns) / stdev_returns) * math.sqrt(252) if stdev_returns > 0 else 0.0
     
     return {
-        "total_trades": total_trades, "net_pnl_abs": sum(pnl_values), "net_pnl_pct": sum(returns),
+        "total_trades": total_trades, "net_pnl_abs": equity, "net_pnl_pct": sum(returns),
         "profit_factor": profit_factor, "win_rate": win_rate, "payoff_ratio": payoff_ratio,
         "avg_win_pnl": avg_win, "avg_loss_pnl": avg_loss, "max_drawdown_pct": max_drawdown_pct,
         "sharpe_ratio_annualized": sharpe_ratio,
@@ -517,6 +517,12 @@ class MainWindow(QMainWindow):
                 except Exception:
                     logger.exception("Failed to stop orders_watcher")
 
+            if getattr(self, "trading_store", None):
+                try:
+                    self.trading_store.shutdown()
+                except Exception:
+                    logger.exception("Failed to shutdown trading_store")
+
             if self.engine and hasattr(self.engine, "shutdown"):
                 try:
                     self.engine.shutdown()
@@ -15,9 +15,23 @@ def today_str() -> str:
     return datetime.now(KST).date().isoformat()
 
 
+_KST_OFFSET_S = 9 * 3600
+
+def kst_day_index(now_ns: int) -> int:
+    """epoch ns → KST 기준 일(day) 인덱스 (datetime 생성 없이 정수 연산만, 날짜 변경 감지용)"""
+    return (now_ns // 1_000_000_000 + _KST_OFFSET_S) // 86400
+
+
+_PATH_TODAY_CACHE: tuple[str, Path | None] = ("", None)  # (날짜, 경로) — 튜플 통째로 교체
+
 def path_today() -> Path:
-    # ✅ 일별 JSONL
-    return BASE_DIR / f"trading_results_{today_str()}.jsonl"
+    # ✅ 일별 JSONL (날짜가 바뀔 때만 Path 재생성)
+    global _PATH_TODAY_CACHE
+    day = today_str()
+    cached = _PATH_TODAY_CACHE
+    if cached[0] != day:
+        cached = _PATH_TODAY_CACHE = (day, BASE_DIR / f"trading_results_{day}.jsonl")
+    return cached[1]
 
 def path_cumulative() -> Path:
     # ✅ 누적 JSONL